@@ -0,0 +1,61 @@
+/**
+ * Node.js side of tests/verify_algorithms.py
+ *
+ * Loads the library once, then answers one JSON request per stdin line.
+ * A request is either a single test or {batch: [...]}, answered with {results: [...]}.
+ */
+
+const path = require("node:path");
+const readline = require("node:readline");
+
+const lib = require(path.resolve(__dirname, "..", "index.js"));
+
+function resolveOptions(options) {
+  const resolved = {};
+  for (const [key, value] of Object.entries(options || {})) {
+    if (typeof value === "string" && value.startsWith("PreprocessingMode.")) {
+      resolved[key] = lib.PreprocessingMode[value.slice("PreprocessingMode.".length)];
+    } else {
+      resolved[key] = value;
+    }
+  }
+  return resolved;
+}
+
+function compute(request) {
+  // Every request must be isolated, as it was with one process per call:
+  // the engine's result cache key does not cover alpha/beta
+  lib.clearCaches();
+  try {
+    const algorithm = lib.AlgorithmType[request.algorithm];
+    if (request.type === "distance") {
+      return lib.calculateDistance(request.str1, request.str2, algorithm);
+    }
+    return lib.calculateSimilarity(
+      request.str1,
+      request.str2,
+      algorithm,
+      resolveOptions(request.options)
+    );
+  } catch (error) {
+    return { success: false, error: error.message };
+  }
+}
+
+// Memo keyed by the full request, so options such as alpha/beta are part of the key
+const cache = new Map();
+
+function run(request) {
+  const key = JSON.stringify(request);
+  if (!cache.has(key)) {
+    cache.set(key, compute(request));
+  }
+  return cache.get(key);
+}
+
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+rl.on("line", (line) => {
+  const request = JSON.parse(line);
+  const response = request.batch ? { results: request.batch.map(run) } : run(request);
+  process.stdout.write(`${JSON.stringify(response)}\n`);
+});